@@ -6,6 +6,19 @@ import os, sys, time, datetime,inspect, json, yaml
 
 
 ################################################################################################
+_pd_read_file_pools = {}   ### Reuse thread pools across calls, keyed by size
+
+
+def _pd_read_file_pools_close():
+    ### terminate cached pools, otherwise interpreter shutdown is noisy
+    for pool in _pd_read_file_pools.values():
+        pool.terminate()
+    _pd_read_file_pools.clear()
+
+
+import atexit; atexit.register(_pd_read_file_pools_close)
+
+
 def pd_read_file(path_glob="*.pkl", ignore_index=True,  cols=None,
                  verbose=False, nrows=-1, concat_sort=True, n_pool=1, drop_duplicates=None, col_filter=None,
                  col_filter_val=None, dtype=None,  **kw):
@@ -15,7 +28,12 @@ def pd_read_file(path_glob="*.pkl", ignore_index=True,  cols=None,
   """
   import glob, gc,  pandas as pd, os
   def log(*s, **kw):
-      print(*s, flush=True, **kw)      
+      print(*s, flush=True, **kw)
+  def read_csv_gz(filei, **kwargs):
+      ### 1MB buffer : many small reads on a gzip stream are expensive
+      import gzip, io
+      with io.BufferedReader(gzip.open(filei, 'rb'), buffer_size=1<<20) as fgz:
+          return pd.read_csv(fgz, **kwargs)
   readers = {
           ".pkl"     : pd.read_pickle,
           ".parquet" : pd.read_parquet,
@@ -23,8 +41,8 @@ def pd_read_file(path_glob="*.pkl", ignore_index=True,  cols=None,
           ".csv"     : pd.read_csv,
           ".txt"     : pd.read_csv,
           ".zip"     : pd.read_csv,
-          ".gzip"    : pd.read_csv,
-          ".gz"      : pd.read_csv,
+          ".gzip"    : read_csv_gz,
+          ".gz"      : read_csv_gz,
    }
   from multiprocessing.pool import ThreadPool
 
@@ -40,6 +58,7 @@ def pd_read_file(path_glob="*.pkl", ignore_index=True,  cols=None,
 
   #### Pool count
   if n_pool < 1 :  n_pool = 1
+  if n_file  > 0:  n_pool = min(n_pool, n_file)   ### no more workers than files
   if n_file <= 0:  m_job  = 0
   elif n_file <= 2:
     m_job  = n_file
@@ -48,7 +67,9 @@ def pd_read_file(path_glob="*.pkl", ignore_index=True,  cols=None,
     m_job  = 1 + n_file // n_pool  if n_file >= 3 else 1
   if verbose : log(n_file,  n_file // n_pool )
 
-  pool   = ThreadPool(processes=n_pool)
+  pool   = _pd_read_file_pools.get(n_pool)
+  if pool is None :
+     pool = _pd_read_file_pools[n_pool] = ThreadPool(processes=n_pool)
   dfall  = pd.DataFrame()
   for j in range(0, m_job ) :
       if verbose : log("Pool", j, end=",")